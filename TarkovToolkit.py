@@ -1,7 +1,14 @@
 import bpy
+import hashlib
+import json
+import math
+import numpy as np
+import os
 import re
 import time
 
+from mathutils import Matrix, Vector
+
 bl_info = {
     "name": "Tarkov Toolkit",
     "version": (1, 0, 1),
@@ -106,14 +113,160 @@ HumanBonesParents = [
     'HumanRPalm001'
 ]
 
+ScopeItems = [
+    ('SCENE', "Whole Scene", "Every object in the scene"),
+    ('COLLECTION', "Active Collection", "Objects in the active collection and its children"),
+    ('SELECTION', "Selection", "Selected objects only"),
+    ('NEW', "Added Since Last Run", "Objects the cleaner has not checked yet"),
+]
+
+def get_seen_names(context, operator):
+    # Checked objects are remembered on the scene per operator, so copies and appended objects never inherit the state
+    seen = context.scene.get("tarkov_seen")
+    if seen is None or operator not in seen:
+        return set()
+    return set(seen[operator].split("\n"))
+
+def get_scope_objects(context, operator):
+    scope = context.scene.tarkov_scope
+    if scope == 'COLLECTION':
+        return list(context.view_layer.active_layer_collection.collection.all_objects)
+    if scope == 'SELECTION':
+        return list(context.selected_objects)
+    if scope == 'NEW':
+        seen = get_seen_names(context, operator)
+        return [obj for obj in context.scene.objects if obj.name_full not in seen]
+    return list(context.scene.objects)
+
+def mark_scope_seen(context, operator, objects):
+    if context.scene.library:
+        return
+
+    seen = get_seen_names(context, operator)
+    seen.update(obj.name_full for obj in objects if not is_removed(obj))
+
+    if "tarkov_seen" not in context.scene:
+        context.scene["tarkov_seen"] = {}
+    context.scene["tarkov_seen"][operator] = "\n".join(seen)
+
+def is_removed(obj):
+    try:
+        obj.name
+    except ReferenceError:
+        return True
+    return False
+
+def get_file_hash(path):
+    digest = hashlib.sha1()
+    with open(path, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def get_bound_meshes(armature):
+    meshes = []
+    for obj in bpy.data.objects:
+        if obj.type != 'MESH':
+            continue
+        if obj.parent == armature or any(mod.type == 'ARMATURE' and mod.object == armature for mod in obj.modifiers):
+            meshes.append(obj)
+    return meshes
+
+def remove_bone_vertex_groups(armature, bone_names):
+    removed_count = 0
+    for obj in get_bound_meshes(armature):
+        for group in [group for group in obj.vertex_groups if group.name in bone_names]:
+            obj.vertex_groups.remove(group)
+            removed_count += 1
+    return removed_count
+
+WeaponPresetCache = {}
+WeaponPresetItems = []
+
+def get_weapon_preset_dir():
+    return bpy.utils.user_resource('DATAFILES', path=os.path.join("tarkov_toolkit", "presets"), create=True)
+
+def get_weapon_preset_path(name):
+    return os.path.join(get_weapon_preset_dir(), bpy.path.clean_name(name) + ".json")
+
+def get_bone_layout_hash(armature):
+    bones = armature.data.bones
+    heads = np.empty(len(bones) * 3, dtype=np.float32)
+    bones.foreach_get("head_local", heads)
+
+    digest = hashlib.sha1(np.round(heads, 5).tobytes())
+    for bone in bones:
+        digest.update(f"{bone.name}:{bone.parent.name if bone.parent else ''};".encode())
+    return digest.hexdigest()
+
+def get_weapon_preset_items(self, context):
+    WeaponPresetItems.clear()
+    names = set(WeaponPresetCache)
+    names.update(os.path.splitext(file)[0] for file in os.listdir(get_weapon_preset_dir()) if file.endswith(".json"))
+    for name in sorted(names):
+        WeaponPresetItems.append((name, name, ""))
+    return WeaponPresetItems
+
 class OBJECT_OT_LoadMagazines(bpy.types.Operator):
     bl_idname = "object.load_tarkov_magazines"
     bl_label = "Load Magazine"
     bl_description = "Moves selected objects that ends with '.Patron.XXX' to the corresponding bone '_patron_XXX' and parents them"
-    
+    bl_options = {'REGISTER', 'UNDO'}
+
+    use_instances: bpy.props.BoolProperty(name="Instance Cartridge", description="Fills every 'patron_XXX' bone with linked duplicates of a single selected cartridge", default=False)
+    round_count: bpy.props.IntProperty(name="Rounds", description="Number of rounds to load, 0 fills the whole magazine", default=0, min=0)
+
+    def fillInstances(self, cartridge, armature):
+        bones = []
+        for bone in armature.pose.bones:
+            match = re.match(r"patron_(\d+)$", bone.name)
+            if match:
+                bones.append((int(match.group(1)), bone))
+        bones.sort(key=lambda item: item[0])
+
+        if self.round_count:
+            bones = bones[:self.round_count]
+
+        base_name = re.sub(r"\.Patron\.\d+$", "", cartridge.name)
+        collections = cartridge.users_collection
+        cartridge_matrix = cartridge.matrix_world.copy()
+
+        # The selected cartridge takes the first bone, every other round shares its mesh data
+        for i, (number, bone) in enumerate(bones):
+            if i == 0:
+                obj = cartridge
+            else:
+                obj = cartridge.copy()
+                for collection in collections:
+                    collection.objects.link(obj)
+            obj.name = f"{base_name}.Patron.{str(number).zfill(3)}"
+
+            world_matrix = cartridge_matrix.copy()
+            world_matrix.translation = armature.matrix_world @ bone.head
+
+            obj.parent = armature
+            obj.parent_type = 'BONE'
+            obj.parent_bone = bone.name
+            obj.matrix_world = world_matrix
+
+        return len(bones)
+
     def execute(self, context):
         active_armature = context.active_object
 
+        if active_armature and active_armature.type == 'ARMATURE' and self.use_instances:
+            cartridges = [obj for obj in context.selected_objects if obj != active_armature]
+            if len(cartridges) != 1:
+                self.report({'WARNING'}, "Select exactly one cartridge object.")
+                return {'CANCELLED'}
+
+            if context.mode != 'OBJECT':
+                bpy.ops.object.mode_set(mode='OBJECT')
+
+            loaded_count = self.fillInstances(cartridges[0], active_armature)
+            self.report({'INFO'}, f"Magazine '{active_armature.name}' loaded with " + str(loaded_count) + " rounds.")
+            return {'FINISHED'}
+
         if active_armature and active_armature.type == 'ARMATURE':
             for obj in context.selected_objects:
                 if obj != active_armature:
@@ -178,7 +331,13 @@ class CleanLODMaterials(bpy.types.Operator):
         materials_to_remove = []
         MaterialLODs = ['_LOD1', '_LOD2', '_LOD3']
 
-        for mat in bpy.data.materials:
+        objects = get_scope_objects(context, self.bl_idname)
+        if context.scene.tarkov_scope == 'SCENE':
+            materials = bpy.data.materials
+        else:
+            materials = {slot.material for obj in objects for slot in obj.material_slots if slot.material}
+
+        for mat in materials:
             if any(mat.name.endswith(lod) for lod in MaterialLODs):
                 materials_to_remove.append(mat.name)
 
@@ -190,9 +349,123 @@ class CleanLODMaterials(bpy.types.Operator):
                 bpy.data.materials.remove(mat)
                 self.removed_count += 1
 
+        mark_scope_seen(context, self.bl_idname, objects)
         self.report({'INFO'}, f'LOD: Total removed: ' + str(self.removed_count) + ' materials.')
         return {'FINISHED'}
 
+class OBJECT_OT_DeduplicateImages(bpy.types.Operator):
+    bl_idname = "object.deduplicate_images"
+    bl_label = "Merge Duplicate Images"
+    bl_description = "Merges images with identical pixel data into one and remaps all of their users"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    removed_count: bpy.props.IntProperty(default=0)
+
+    def pixel_hash(self, image, pixels):
+        image.pixels.foreach_get(pixels)
+        return hashlib.sha1(pixels.tobytes()).hexdigest()
+
+    def execute(self, context):
+        self.removed_count = 0
+
+        # Only images sharing the same dimensions and color settings can be duplicates, so skip hashing everything else
+        by_size = {}
+        for image in bpy.data.images:
+            if image.type not in {'IMAGE', 'UV_TEST'}:
+                continue
+
+            size = (image.size[0], image.size[1], image.channels)
+            if size[0] and size[1]:
+                key = size + (image.colorspace_settings.name, image.alpha_mode)
+                by_size.setdefault(key, []).append(image)
+
+        for images in by_size.values():
+            if len(images) < 2:
+                continue
+
+            # Images in one bucket share their size, so a single pixel buffer is reused for all of them
+            pixels = np.empty(len(images[0].pixels), dtype=np.float32)
+            originals = {}
+            for image in images:
+                digest = self.pixel_hash(image, pixels)
+                original = originals.setdefault(digest, image)
+                if original != image:
+                    print(f'({self.removed_count + 1}) Merged {image.name} into {original.name}')
+                    image.user_remap(original)
+                    bpy.data.images.remove(image)
+                    self.removed_count += 1
+
+        self.report({'INFO'}, f'Images: Total merged: ' + str(self.removed_count) + ' duplicates')
+        return {'FINISHED'}
+
+class OBJECT_OT_UseImageProxies(bpy.types.Operator):
+    bl_idname = "object.use_image_proxies"
+    bl_label = "Use Viewport Image Proxies"
+    bl_description = "Swaps large images for downscaled copies cached on disk, keyed by the hash of the source file"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    proxy_size: bpy.props.IntProperty(name="Proxy Size", default=512, min=16, max=8192)
+
+    swapped_count: bpy.props.IntProperty(default=0)
+    created_count: bpy.props.IntProperty(default=0)
+
+    def create_proxy(self, image, proxy_path):
+        scale = self.proxy_size / max(image.size)
+        proxy = image.copy()
+        proxy.scale(max(1, round(image.size[0] * scale)), max(1, round(image.size[1] * scale)))
+        proxy.filepath_raw = proxy_path
+        proxy.file_format = 'PNG'
+        proxy.save()
+        bpy.data.images.remove(proxy)
+        self.created_count += 1
+
+    def execute(self, context):
+        self.swapped_count = 0
+        self.created_count = 0
+
+        cache_dir = bpy.utils.user_resource('DATAFILES', path=os.path.join("tarkov_toolkit", "proxies"), create=True)
+
+        for image in bpy.data.images:
+            if image.type != 'IMAGE' or image.packed_file or "tarkov_full_path" in image:
+                continue
+
+            source_path = bpy.path.abspath(image.filepath)
+            if not os.path.isfile(source_path) or max(image.size) <= self.proxy_size:
+                continue
+
+            proxy_path = os.path.join(cache_dir, f"{get_file_hash(source_path)}_{self.proxy_size}.png")
+            if not os.path.isfile(proxy_path):
+                self.create_proxy(image, proxy_path)
+
+            image["tarkov_full_path"] = image.filepath
+            image.filepath = proxy_path
+            image.reload()
+            self.swapped_count += 1
+
+        self.report({'INFO'}, f'Images: Swapped ' + str(self.swapped_count) + ' images to proxies, ' + str(self.created_count) + ' newly cached')
+        return {'FINISHED'}
+
+class OBJECT_OT_RestoreImageProxies(bpy.types.Operator):
+    bl_idname = "object.restore_image_proxies"
+    bl_label = "Restore Full Images"
+    bl_description = "Swaps viewport image proxies back to their full resolution sources for final renders"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    restored_count: bpy.props.IntProperty(default=0)
+
+    def execute(self, context):
+        self.restored_count = 0
+
+        for image in bpy.data.images:
+            if "tarkov_full_path" in image:
+                image.filepath = image["tarkov_full_path"]
+                del image["tarkov_full_path"]
+                image.reload()
+                self.restored_count += 1
+
+        self.report({'INFO'}, f'Images: Restored ' + str(self.restored_count) + ' full resolution images')
+        return {'FINISHED'}
+
 class OBJECT_OT_CleanLODMeshes(bpy.types.Operator):
     bl_idname = "object.remove_lod_meshes"
     bl_label = "Clean Level Of Detail Meshes"
@@ -243,18 +516,18 @@ class OBJECT_OT_CleanLODMeshes(bpy.types.Operator):
         self.removed_child_count = 0
         self.avg_time = []
 
-        print('Checking ' + str(len(bpy.context.scene.objects)) + ' objects')
+        objects = get_scope_objects(context, self.bl_idname)
+        print('Checking ' + str(len(objects)) + ' objects')
 
-        # Loop through all objects in the scene
-        for obj in bpy.context.scene.objects:
+        for obj in objects:
             for regex in self.regex_list:
                 pattern = re.compile(regex, re.IGNORECASE | re.DOTALL)
-                if obj and pattern.match(obj.name):
+                if not is_removed(obj) and pattern.match(obj.name):
                     self.remove(obj)
                     break
 
-        for obj in bpy.context.scene.objects:
-            if obj.parent is None:
+        for obj in objects:
+            if is_removed(obj) or obj.parent is None:
                 continue
 
             for regex in self.regex_list_lod:
@@ -274,6 +547,7 @@ class OBJECT_OT_CleanLODMeshes(bpy.types.Operator):
                         self.remove(obj)
                     break
 
+        mark_scope_seen(context, self.bl_idname, objects)
         self.report({'INFO'}, f'LOD: Total removed: ' + str(self.removed_count) + ' objects with ' + str(self.removed_child_count) + ' children')
         return {'FINISHED'}
 
@@ -326,20 +600,17 @@ class OBJECT_OT_CleanShadowMeshes(bpy.types.Operator):
         self.removed_child_count = 0
         self.avg_time = []
 
-        print('Checking ' + str(len(bpy.context.scene.objects)) + ' objects')
+        objects = get_scope_objects(context, self.bl_idname)
+        print('Checking ' + str(len(objects)) + ' objects')
 
-        # Loop through all objects in the scene
-        for obj in bpy.context.scene.objects:
+        for obj in objects:
             for regex in self.regex_list:
                 pattern = re.compile(regex, re.IGNORECASE | re.DOTALL)
-                if obj and pattern.match(obj.name):
+                if not is_removed(obj) and pattern.match(obj.name):
                     self.remove(obj)
                     break
 
-        for obj in bpy.context.scene.objects:
-            if obj.parent is None:
-                continue
-
+        mark_scope_seen(context, self.bl_idname, objects)
         print('Total removed: ' + str(self.removed_count) + ' objects with ' + str(self.removed_child_count) + ' children')
         self.report({'INFO'}, f'Total removed: ' + str(self.removed_count) + ' objects with ' + str(self.removed_child_count) + ' children')
         return {'FINISHED'}
@@ -392,19 +663,17 @@ class OBJECT_OT_CleanTriggerMeshes(bpy.types.Operator):
         self.removed_child_count = 0
         self.avg_time = []
 
-        print('Checking ' + str(len(bpy.context.scene.objects)) + ' objects')
+        objects = get_scope_objects(context, self.bl_idname)
+        print('Checking ' + str(len(objects)) + ' objects')
 
-        for obj in bpy.context.scene.objects:
+        for obj in objects:
             for regex in self.regex_list:
                 pattern = re.compile(regex, re.IGNORECASE | re.DOTALL)
-                if obj and pattern.match(obj.name):
+                if not is_removed(obj) and pattern.match(obj.name):
                     self.remove(obj)
                     break
 
-        for obj in bpy.context.scene.objects:
-            if obj.parent is None:
-                continue
-
+        mark_scope_seen(context, self.bl_idname, objects)
         print('Total removed: ' + str(self.removed_count) + ' objects with ' + str(self.removed_child_count) + ' children')
         self.report({'INFO'}, f'Total removed: ' + str(self.removed_count) + ' objects with ' + str(self.removed_child_count) + ' children')
         return {'FINISHED'}
@@ -457,19 +726,17 @@ class OBJECT_OT_CleanDoorHandMeshes(bpy.types.Operator):
         self.removed_child_count = 0
         self.avg_time = []
 
-        print('Checking ' + str(len(bpy.context.scene.objects)) + ' objects')
+        objects = get_scope_objects(context, self.bl_idname)
+        print('Checking ' + str(len(objects)) + ' objects')
 
-        for obj in bpy.context.scene.objects:
+        for obj in objects:
             for regex in self.regex_list:
                 pattern = re.compile(regex, re.IGNORECASE | re.DOTALL)
-                if obj and pattern.match(obj.name):
+                if not is_removed(obj) and pattern.match(obj.name):
                     self.remove(obj)
                     break
 
-        for obj in bpy.context.scene.objects:
-            if obj.parent is None:
-                continue
-
+        mark_scope_seen(context, self.bl_idname, objects)
         self.report({'INFO'}, f'Door: Total removed: ' + str(self.removed_count) + ' objects with ' + str(self.removed_child_count) + ' children')
         return {'FINISHED'}
 
@@ -521,19 +788,17 @@ class OBJECT_OT_CleanCullingMeshes(bpy.types.Operator):
         self.removed_child_count = 0
         self.avg_time = []
 
-        print('Checking ' + str(len(bpy.context.scene.objects)) + ' objects')
+        objects = get_scope_objects(context, self.bl_idname)
+        print('Checking ' + str(len(objects)) + ' objects')
 
-        for obj in bpy.context.scene.objects:
+        for obj in objects:
             for regex in self.regex_list:
                 pattern = re.compile(regex, re.IGNORECASE | re.DOTALL)
-                if obj and pattern.match(obj.name):
+                if not is_removed(obj) and pattern.match(obj.name):
                     self.remove(obj)
                     break
 
-        for obj in bpy.context.scene.objects:
-            if obj.parent is None:
-                continue
-
+        mark_scope_seen(context, self.bl_idname, objects)
         self.report({'INFO'}, f'Culling: Total removed: ' + str(self.removed_count) + ' objects with ' + str(self.removed_child_count) + ' children')
         return {'FINISHED'}
 
@@ -585,26 +850,218 @@ class OBJECT_OT_CleanColliderMeshes(bpy.types.Operator):
         self.removed_child_count = 0
         self.avg_time = []
 
-        print('Checking ' + str(len(bpy.context.scene.objects)) + ' objects')
+        objects = get_scope_objects(context, self.bl_idname)
+        print('Checking ' + str(len(objects)) + ' objects')
 
-        for obj in bpy.context.scene.objects:
+        for obj in objects:
             for regex in self.regex_list:
                 pattern = re.compile(regex, re.IGNORECASE | re.DOTALL)
-                if obj and pattern.match(obj.name):
+                if not is_removed(obj) and pattern.match(obj.name):
                     self.remove(obj)
                     break
 
-        for obj in bpy.context.scene.objects:
-            if obj.parent is None:
-                continue
-
+        mark_scope_seen(context, self.bl_idname, objects)
         self.report({'INFO'}, f'Colliders: Total removed: ' + str(self.removed_count) + ' objects with ' + str(self.removed_child_count) + ' children')
         return {'FINISHED'}
 
+class OBJECT_OT_MergeMapChunks(bpy.types.Operator):
+    bl_idname = "object.merge_map_chunks"
+    bl_label = "Merge Meshes By Chunks"
+    bl_description = "Joins static meshes sharing the same materials inside each cell of a uniform 3D grid"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    cell_size: bpy.props.FloatProperty(name="Cell Size", default=50.0, min=0.01, unit='LENGTH')
+
+    merged_count: bpy.props.IntProperty(default=0)
+    created_count: bpy.props.IntProperty(default=0)
+
+    def is_static(self, obj):
+        if obj.type != 'MESH' or obj.data is None or len(obj.data.polygons) == 0:
+            return False
+
+        # Anything animated, deformed or holding other objects has to stay separate
+        if obj.children or obj.parent_type == 'BONE' or obj.animation_data or obj.modifiers or obj.data.shape_keys:
+            return False
+
+        parent = obj.parent
+        while parent:
+            if parent.animation_data:
+                return False
+            parent = parent.parent
+
+        # Color attributes can live on any domain and type, merging them is not supported
+        if obj.data.color_attributes:
+            return False
+
+        # Mirrored objects would need their winding flipped, leave them alone
+        return obj.matrix_world.determinant() > 0
+
+    def get_cell(self, obj):
+        matrix = obj.matrix_world
+        center = sum((matrix @ Vector(corner) for corner in obj.bound_box), Vector()) / 8
+        return tuple(math.floor(axis / self.cell_size) for axis in center)
+
+    def get_corner_normals(self, mesh):
+        normals = np.empty(len(mesh.loops) * 3, dtype=np.float32)
+        if hasattr(mesh, "corner_normals"):
+            mesh.corner_normals.foreach_get("vector", normals)
+        else:
+            mesh.calc_normals_split()
+            mesh.loops.foreach_get("normal", normals)
+        return normals.reshape(-1, 3)
+
+    def merge(self, objects, cell):
+        origin = np.array([(axis + 0.5) * self.cell_size for axis in cell])
+        uv_names = list(dict.fromkeys(name for obj in objects for name in obj.data.uv_layers.keys()))
+        use_custom_normals = any(obj.data.has_custom_normals for obj in objects)
+
+        coords, loop_verts, loop_edges, loop_starts, mat_indices, smooth = [], [], [], [], [], []
+        edge_verts, seams, sharp_edges, normals = [], [], [], []
+        uvs = [[] for _ in uv_names]
+        vert_offset = 0
+        edge_offset = 0
+        loop_offset = 0
+
+        for obj in objects:
+            mesh = obj.data
+            vert_total = len(mesh.vertices)
+            edge_total = len(mesh.edges)
+            loop_total = len(mesh.loops)
+            poly_total = len(mesh.polygons)
+
+            co = np.empty(vert_total * 3, dtype=np.float32)
+            mesh.vertices.foreach_get("co", co)
+            matrix = np.array(obj.matrix_world)
+            coords.append(co.reshape(-1, 3) @ matrix[:3, :3].T + matrix[:3, 3] - origin)
+
+            verts = np.empty(edge_total * 2, dtype=np.int32)
+            mesh.edges.foreach_get("vertices", verts)
+            edge_verts.append(verts + vert_offset)
+
+            flags = np.empty(edge_total, dtype=bool)
+            mesh.edges.foreach_get("use_seam", flags)
+            seams.append(flags)
+
+            flags = np.empty(edge_total, dtype=bool)
+            mesh.edges.foreach_get("use_edge_sharp", flags)
+            sharp_edges.append(flags)
+
+            verts = np.empty(loop_total, dtype=np.int32)
+            mesh.loops.foreach_get("vertex_index", verts)
+            loop_verts.append(verts + vert_offset)
+
+            edges = np.empty(loop_total, dtype=np.int32)
+            mesh.loops.foreach_get("edge_index", edges)
+            loop_edges.append(edges + edge_offset)
+
+            if use_custom_normals:
+                normal_matrix = np.linalg.inv(matrix[:3, :3]).T
+                world_normals = self.get_corner_normals(mesh) @ normal_matrix.T
+                world_normals /= np.maximum(np.linalg.norm(world_normals, axis=1, keepdims=True), 1e-8)
+                normals.append(world_normals)
+
+            starts = np.empty(poly_total, dtype=np.int32)
+            mesh.polygons.foreach_get("loop_start", starts)
+            loop_starts.append(starts + loop_offset)
+
+            indices = np.empty(poly_total, dtype=np.int32)
+            mesh.polygons.foreach_get("material_index", indices)
+            mat_indices.append(indices)
+
+            flags = np.empty(poly_total, dtype=bool)
+            mesh.polygons.foreach_get("use_smooth", flags)
+            smooth.append(flags)
+
+            for name, layer_uvs in zip(uv_names, uvs):
+                uv = np.zeros(loop_total * 2, dtype=np.float32)
+                uv_layer = mesh.uv_layers.get(name)
+                if uv_layer:
+                    uv_layer.data.foreach_get("uv", uv)
+                layer_uvs.append(uv)
+
+            vert_offset += vert_total
+            edge_offset += edge_total
+            loop_offset += loop_total
+
+        poly_offset = sum(len(indices) for indices in mat_indices)
+
+        mesh = bpy.data.meshes.new(f"Chunk_{cell[0]}_{cell[1]}_{cell[2]}")
+        mesh.vertices.add(vert_offset)
+        mesh.edges.add(edge_offset)
+        mesh.loops.add(loop_offset)
+        mesh.polygons.add(poly_offset)
+
+        mesh.vertices.foreach_set("co", np.concatenate(coords).astype(np.float32).ravel())
+        mesh.edges.foreach_set("vertices", np.concatenate(edge_verts))
+        mesh.edges.foreach_set("use_seam", np.concatenate(seams))
+        mesh.edges.foreach_set("use_edge_sharp", np.concatenate(sharp_edges))
+        mesh.loops.foreach_set("vertex_index", np.concatenate(loop_verts))
+        mesh.loops.foreach_set("edge_index", np.concatenate(loop_edges))
+        mesh.polygons.foreach_set("loop_start", np.concatenate(loop_starts))
+        mesh.polygons.foreach_set("material_index", np.concatenate(mat_indices))
+        mesh.polygons.foreach_set("use_smooth", np.concatenate(smooth))
+
+        for name, uv in zip(uv_names, uvs):
+            mesh.uv_layers.new(name=name).data.foreach_set("uv", np.concatenate(uv))
+
+        for slot in objects[0].material_slots:
+            mesh.materials.append(slot.material)
+
+        mesh.update()
+
+        if use_custom_normals:
+            # Blender 4.0 still needs auto smooth enabled for custom normals to be used
+            if hasattr(mesh, "use_auto_smooth"):
+                mesh.use_auto_smooth = True
+            mesh.normals_split_custom_set(np.concatenate(normals).astype(np.float32))
+
+        chunk = bpy.data.objects.new(mesh.name, mesh)
+        chunk.location = origin
+        objects[0].users_collection[0].objects.link(chunk)
+
+        self.merged_objects += objects
+        self.merged_count += len(objects)
+        self.created_count += 1
+        print(f'({self.created_count}) Merged {len(objects)} objects into {chunk.name}')
+        return chunk
+
+    def execute(self, context):
+        self.merged_count = 0
+        self.created_count = 0
+        self.merged_objects = []
+
+        objects = get_scope_objects(context, self.bl_idname)
+        print('Checking ' + str(len(objects)) + ' objects')
+
+        groups = {}
+        for obj in objects:
+            if self.is_static(obj):
+                materials = tuple(slot.material.name if slot.material else '' for slot in obj.material_slots)
+                groups.setdefault((self.get_cell(obj), materials), []).append(obj)
+
+        chunks = []
+        for (cell, materials), group_objects in groups.items():
+            if len(group_objects) > 1:
+                chunks.append(self.merge(group_objects, cell))
+
+        # Removing everything in one batch avoids rebuilding the object relations after every single object
+        source_meshes = {obj.data for obj in self.merged_objects}
+        bpy.data.batch_remove(self.merged_objects)
+        bpy.data.batch_remove([mesh for mesh in source_meshes if mesh.users == 0])
+
+        bpy.context.view_layer.update()
+
+        mark_scope_seen(context, self.bl_idname, objects + chunks)
+        self.report({'INFO'}, f'Chunks: Merged ' + str(self.merged_count) + ' objects into ' + str(self.created_count) + ' chunks')
+        return {'FINISHED'}
+
 class OBJECT_OT_CleanHumanBones(bpy.types.Operator):
     bl_idname = "object.clean_human_bones"
     bl_label = "Clean Human Bones"
     bl_description = "Removes 'Base HumanLCollarbone' and 'Base HumanRCollarbone' and its children"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    remove_vertex_groups: bpy.props.BoolProperty(name="Remove Vertex Groups", description="Also removes vertex groups of the removed bones from meshes bound to the armature", default=False)
 
     removed_count: bpy.props.IntProperty(default=0)
     removed_child_count: bpy.props.IntProperty(default=0)
@@ -619,18 +1076,27 @@ class OBJECT_OT_CleanHumanBones(bpy.types.Operator):
             bpy.context.view_layer.objects.active = armature
             bpy.ops.object.mode_set(mode='EDIT')
 
+            removed_names = set()
+
             for bone_name in HumanBonesParents:
                 bone = armature.data.edit_bones.get(bone_name)
 
                 if bone:
                     for child in bone.children_recursive:
+                        removed_names.add(child.name)
                         armature.data.edit_bones.remove(child)
                         self.removed_child_count += 1
+                    removed_names.add(bone.name)
                     armature.data.edit_bones.remove(bone)
                     self.removed_count += 1
 
             bpy.ops.object.mode_set(mode='OBJECT')
-            self.report({'INFO'}, f'Bones: Total removed: ' + str(self.removed_count) + ' bones with ' + str(self.removed_child_count) + ' children')
+
+            groups_str = ''
+            if self.remove_vertex_groups:
+                groups_str = ' and ' + str(remove_bone_vertex_groups(armature, removed_names)) + ' vertex groups'
+
+            self.report({'INFO'}, f'Bones: Total removed: ' + str(self.removed_count) + ' bones with ' + str(self.removed_child_count) + ' children' + groups_str)
             return {'FINISHED'}
         else:
             self.report({'ERROR'}, "No active armature found.")
@@ -640,6 +1106,9 @@ class OBJECT_OT_CleanEngineBones(bpy.types.Operator):
     bl_idname = "object.clean_engine_bones"
     bl_label = "Clean Weapon Engine Bones"
     bl_description = "Removes engine's weapon pointers in a armature"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    remove_vertex_groups: bpy.props.BoolProperty(name="Remove Vertex Groups", description="Also removes vertex groups of the removed bones from meshes bound to the armature", default=False)
 
     removed_count: bpy.props.IntProperty(default=0)
 
@@ -652,14 +1121,22 @@ class OBJECT_OT_CleanEngineBones(bpy.types.Operator):
             bpy.context.view_layer.objects.active = armature
             bpy.ops.object.mode_set(mode='EDIT')
 
+            removed_names = set()
+
             for bone_name in EngineBonesNames:
                 bone = armature.data.edit_bones.get(bone_name)
                 if bone:
+                    removed_names.add(bone.name)
                     armature.data.edit_bones.remove(bone)
                     self.removed_count += 1
 
             bpy.ops.object.mode_set(mode='OBJECT')
-            self.report({'INFO'}, f'Bones: Total removed: ' + str(self.removed_count) + ' bones')
+
+            groups_str = ''
+            if self.remove_vertex_groups:
+                groups_str = ' and ' + str(remove_bone_vertex_groups(armature, removed_names)) + ' vertex groups'
+
+            self.report({'INFO'}, f'Bones: Total removed: ' + str(self.removed_count) + ' bones' + groups_str)
             return {'FINISHED'}
         else:
             self.report({'ERROR'}, "No active armature found.")
@@ -723,10 +1200,133 @@ class OBJECT_OT_AssemblyWeapon(bpy.types.Operator):
             self.report({'WARNING'}, "No active armature selected.")
             return {'CANCELLED'}
 
+class OBJECT_OT_SaveWeaponPreset(bpy.types.Operator):
+    bl_idname = "object.save_weapon_preset"
+    bl_label = "Save Weapon Preset"
+    bl_description = "Saves attachments assembled on the active armature as a preset that can be re-applied in one batch"
+
+    preset_name: bpy.props.StringProperty(name="Name", default="Weapon")
+
+    def collect(self, armature, root_inverse, entries, layouts):
+        layouts[armature.name] = get_bone_layout_hash(armature)
+
+        for child in armature.children:
+            if child.parent_type != 'BONE':
+                continue
+
+            matrix = root_inverse @ child.matrix_world
+            entries.append({
+                "object": child.name,
+                "parent": armature.name,
+                "bone": child.parent_bone,
+                "matrix": [value for row in matrix for value in row],
+            })
+
+            if child.type == 'ARMATURE':
+                self.collect(child, root_inverse, entries, layouts)
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        root = context.active_object
+
+        if root and root.type == 'ARMATURE':
+            entries = []
+            layouts = {}
+            self.collect(root, root.matrix_world.inverted(), entries, layouts)
+
+            if not entries:
+                self.report({'WARNING'}, f"No attachments assembled on '{root.name}'.")
+                return {'CANCELLED'}
+
+            name = bpy.path.clean_name(self.preset_name)
+            preset = {"root": root.name, "layouts": layouts, "entries": entries}
+            with open(get_weapon_preset_path(name), 'w') as file:
+                json.dump(preset, file, separators=(',', ':'))
+            WeaponPresetCache[name] = preset
+
+            self.report({'INFO'}, f"Preset '{name}' saved with " + str(len(entries)) + " attachments.")
+            return {'FINISHED'}
+        else:
+            self.report({'WARNING'}, "No active armature selected.")
+            return {'CANCELLED'}
+
+class OBJECT_OT_ApplyWeaponPreset(bpy.types.Operator):
+    bl_idname = "object.apply_weapon_preset"
+    bl_label = "Apply Weapon Preset"
+    bl_description = "Re-assembles a saved weapon preset on the active armature in one batch"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    preset_name: bpy.props.EnumProperty(name="Preset", items=get_weapon_preset_items)
+
+    def load(self, name):
+        preset = WeaponPresetCache.get(name)
+        if preset is None:
+            path = get_weapon_preset_path(name)
+            if not os.path.isfile(path):
+                return None
+            with open(path) as file:
+                preset = json.load(file)
+            WeaponPresetCache[name] = preset
+        return preset
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        root = context.active_object
+
+        if not root or root.type != 'ARMATURE':
+            self.report({'WARNING'}, "No active armature selected.")
+            return {'CANCELLED'}
+
+        preset = self.load(self.preset_name)
+        if preset is None:
+            self.report({'WARNING'}, f"Preset '{self.preset_name}' not found.")
+            return {'CANCELLED'}
+
+        armatures = {preset["root"]: root}
+        for name in preset["layouts"]:
+            if name != preset["root"]:
+                armatures[name] = bpy.data.objects.get(name)
+
+        for name, armature in armatures.items():
+            if armature is None or armature.type != 'ARMATURE' or get_bone_layout_hash(armature) != preset["layouts"][name]:
+                WeaponPresetCache.pop(self.preset_name, None)
+                self.report({'WARNING'}, f"Bone layout of '{name}' does not match preset '{self.preset_name}', nothing applied.")
+                return {'CANCELLED'}
+
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        applied_count = 0
+        root_matrix = root.matrix_world.copy()
+
+        # Entries are stored parents first, so nested attachments always find their parent in place
+        for entry in preset["entries"]:
+            obj = bpy.data.objects.get(entry["object"])
+            if obj is None:
+                self.report({'WARNING'}, f"Object '{entry['object']}' not found.")
+                continue
+
+            obj.parent = armatures[entry["parent"]]
+            obj.parent_type = 'BONE'
+            obj.parent_bone = entry["bone"]
+            obj.matrix_world = root_matrix @ Matrix([entry["matrix"][i:i + 4] for i in range(0, 16, 4)])
+            applied_count += 1
+
+        context.view_layer.update()
+        self.report({'INFO'}, f"'{root.name}' assembled from preset '{self.preset_name}' with " + str(applied_count) + " attachments.")
+        return {'FINISHED'}
+
 class OBJECT_OT_CleanMuzzleFlashBones(bpy.types.Operator):
     bl_idname = "object.clean_muzzleflash_bones"
     bl_label = "Remove Muzzleflash Bones"
     bl_description = "Removes engine's muzzleflash pointers in a armature"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    remove_vertex_groups: bpy.props.BoolProperty(name="Remove Vertex Groups", description="Also removes vertex groups of the removed bones from meshes bound to the armature", default=False)
 
     removed_count: bpy.props.IntProperty(default=0)
     
@@ -739,19 +1339,252 @@ class OBJECT_OT_CleanMuzzleFlashBones(bpy.types.Operator):
             bpy.context.view_layer.objects.active = armature
             bpy.ops.object.mode_set(mode='EDIT')
 
+            removed_names = set()
+
             for bone in armature.data.edit_bones[:]:
                 if bone.name.startswith("muzzleflash"):
+                    removed_names.add(bone.name)
                     armature.data.edit_bones.remove(bone)
                     self.removed_count += 1
 
             bpy.ops.object.mode_set(mode='OBJECT')
-            self.report({'INFO'}, f'Bones: Total removed: ' + str(self.removed_count) + ' bones')
+
+            groups_str = ''
+            if self.remove_vertex_groups:
+                groups_str = ' and ' + str(remove_bone_vertex_groups(armature, removed_names)) + ' vertex groups'
+
+            self.report({'INFO'}, f'Bones: Total removed: ' + str(self.removed_count) + ' bones' + groups_str)
             return {'FINISHED'}
         else:
             self.report({'ERROR'}, "No active armature found.")
             return {'CANCELLED'}
 
 
+class OBJECT_OT_CleanActions(bpy.types.Operator):
+    bl_idname = "object.clean_actions"
+    bl_label = "Clean Animations"
+    bl_description = "Removes F-curves of bones missing in the active armature and decimates redundant keyframes"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    all_actions: bpy.props.BoolProperty(name="All Actions", description="Cleans every action with bone curves instead of only the ones used by the armature", default=False)
+    tolerance: bpy.props.FloatProperty(name="Tolerance", description="Maximum difference from the interpolated neighbours for a key to be removed", default=0.0001, min=0.0, precision=5)
+
+    removed_count: bpy.props.IntProperty(default=0)
+    removed_key_count: bpy.props.IntProperty(default=0)
+
+    bone_path_regex = re.compile(r'pose\.bones\["(.+?)"\]')
+
+    interpolation_items = bpy.types.Keyframe.bl_rna.properties['interpolation'].enum_items
+    linear_value = interpolation_items['LINEAR'].value
+    constant_value = interpolation_items['CONSTANT'].value
+
+    keyframe_float_properties = [("co", 2), ("handle_left", 2), ("handle_right", 2), ("back", 1), ("amplitude", 1), ("period", 1)]
+    keyframe_enum_properties = ["interpolation", "handle_left_type", "handle_right_type", "easing", "type"]
+
+    def get_actions(self, armature, bone_names):
+        actions = []
+        animation_data = armature.animation_data
+        if animation_data:
+            if animation_data.action:
+                actions.append(animation_data.action)
+            for track in animation_data.nla_tracks:
+                for strip in track.strips:
+                    if strip.action and strip.action not in actions:
+                        actions.append(strip.action)
+
+        # Other actions are only taken when they animate bones of this armature, so other rigs keep their curves
+        if self.all_actions:
+            for action in bpy.data.actions:
+                if action in actions:
+                    continue
+                for fcurve in action.fcurves:
+                    match = self.bone_path_regex.match(fcurve.data_path)
+                    if match and match.group(1) in bone_names:
+                        actions.append(action)
+                        break
+        return actions
+
+    def prune(self, action, bone_names):
+        for fcurve in action.fcurves[:]:
+            match = self.bone_path_regex.match(fcurve.data_path)
+            if match and match.group(1) not in bone_names:
+                action.fcurves.remove(fcurve)
+                self.removed_count += 1
+
+        for group in action.groups[:]:
+            if not group.channels:
+                action.groups.remove(group)
+
+    def fits(self, x, y, start, end, mode):
+        if mode == self.constant_value:
+            expected = y[start]
+        else:
+            factor = (x[start + 1:end] - x[start]) / (x[end] - x[start])
+            expected = y[start] + (y[end] - y[start]) * factor
+        return np.abs(y[start + 1:end] - expected).max() <= self.tolerance
+
+    def decimate(self, fcurve):
+        keyframe_points = fcurve.keyframe_points
+        count = len(keyframe_points)
+        if count < 3:
+            return
+
+        co = np.empty(count * 2, dtype=np.float32)
+        keyframe_points.foreach_get("co", co)
+        x, y = co[0::2], co[1::2]
+        interpolation = np.empty(count, dtype=np.int32)
+        keyframe_points.foreach_get("interpolation", interpolation)
+        keep = np.ones(count, dtype=bool)
+
+        # Bezier segments depend on handles that get recalculated, so only linear and constant runs are decimated.
+        # Each run is grown while every key inside it still lies on the new segment, so no dropped key exceeds the tolerance.
+        start = 0
+        while start < count - 2:
+            mode = interpolation[start]
+            if mode != self.linear_value and mode != self.constant_value:
+                start += 1
+                continue
+
+            end = start + 2
+            while end < count and interpolation[end - 1] == mode and self.fits(x, y, start, end, mode):
+                end += 1
+
+            keep[start + 1:end - 1] = False
+            start = end - 1
+
+        kept_count = int(np.count_nonzero(keep))
+        if kept_count == count:
+            return
+
+        values = {}
+        for name, size in self.keyframe_float_properties:
+            data = np.empty(count * size, dtype=np.float32)
+            keyframe_points.foreach_get(name, data)
+            values[name] = data.reshape(count, size)[keep].ravel()
+        for name in self.keyframe_enum_properties:
+            data = np.empty(count, dtype=np.int32)
+            keyframe_points.foreach_get(name, data)
+            values[name] = data[keep]
+
+        # Rebuilding the keys in bulk is much cheaper than removing them one by one
+        keyframe_points.clear()
+        keyframe_points.add(kept_count)
+        for name, data in values.items():
+            keyframe_points.foreach_set(name, data)
+        fcurve.update()
+        self.removed_key_count += count - kept_count
+
+    def execute(self, context):
+        self.removed_count = 0
+        self.removed_key_count = 0
+
+        armature = context.active_object
+
+        if armature and armature.type == 'ARMATURE':
+            bone_names = set(armature.data.bones.keys())
+            actions = self.get_actions(armature, bone_names)
+
+            for action in actions:
+                self.prune(action, bone_names)
+                for fcurve in action.fcurves:
+                    self.decimate(fcurve)
+
+            self.report({'INFO'}, f'Animations: Total removed: ' + str(self.removed_count) + ' curves and ' + str(self.removed_key_count) + ' keyframes in ' + str(len(actions)) + ' actions')
+            return {'FINISHED'}
+        else:
+            self.report({'ERROR'}, "No active armature found.")
+            return {'CANCELLED'}
+
+class OBJECT_OT_CleanVertexGroups(bpy.types.Operator):
+    bl_idname = "object.clean_vertex_groups"
+    bl_label = "Clean Vertex Groups"
+    bl_description = "Removes empty and zero weight vertex groups and normalizes bone weights of selected meshes or meshes bound to the selected armatures"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    threshold: bpy.props.FloatProperty(name="Threshold", description="Weights at or below this value are treated as zero", default=0.0, min=0.0, max=1.0)
+    normalize: bpy.props.BoolProperty(name="Normalize", description="Normalizes the weights of bone vertex groups so they add up to one per vertex", default=True)
+
+    removed_count: bpy.props.IntProperty(default=0)
+    removed_weight_count: bpy.props.IntProperty(default=0)
+
+    def get_armature(self, obj):
+        for mod in obj.modifiers:
+            if mod.type == 'ARMATURE' and mod.object:
+                return mod.object
+        if obj.parent and obj.parent.type == 'ARMATURE':
+            return obj.parent
+        return None
+
+    def clean(self, obj):
+        mesh = obj.data
+
+        # Extract all weights in one pass, everything after that works on whole arrays
+        elements, vertex_list, group_list, weight_list = [], [], [], []
+        for vertex in mesh.vertices:
+            for element in vertex.groups:
+                elements.append(element)
+                vertex_list.append(vertex.index)
+                group_list.append(element.group)
+                weight_list.append(element.weight)
+
+        vertices = np.array(vertex_list, dtype=np.int32)
+        groups = np.array(group_list, dtype=np.int32)
+        weights = np.array(weight_list, dtype=np.float32)
+        zero = weights <= self.threshold
+
+        armature = self.get_armature(obj)
+        if self.normalize and armature:
+            bones = armature.data.bones
+            is_bone = np.array([group.name in bones and bones[group.name].use_deform for group in obj.vertex_groups], dtype=bool)
+            deform = ~zero & is_bone[groups]
+
+            sums = np.zeros(len(mesh.vertices), dtype=np.float32)
+            np.add.at(sums, vertices[deform], weights[deform])
+
+            normalized = weights.copy()
+            valid = deform & (sums[vertices] > 0)
+            normalized[valid] = weights[valid] / sums[vertices[valid]]
+
+            for i in np.flatnonzero(np.abs(normalized - weights) > 1e-6):
+                elements[i].weight = normalized[i]
+
+        # Drop zero weights group by group so each group is touched once
+        for group_index in np.unique(groups[zero]):
+            mask = zero & (groups == group_index)
+            obj.vertex_groups[int(group_index)].remove(vertices[mask].tolist())
+            self.removed_weight_count += int(np.count_nonzero(mask))
+
+        used = np.zeros(len(obj.vertex_groups), dtype=bool)
+        used[groups[~zero]] = True
+        for group in [group for group in obj.vertex_groups if not used[group.index]]:
+            obj.vertex_groups.remove(group)
+            self.removed_count += 1
+
+    def execute(self, context):
+        self.removed_count = 0
+        self.removed_weight_count = 0
+
+        meshes = set()
+        for obj in context.selected_objects:
+            if obj.type == 'MESH':
+                meshes.add(obj)
+            elif obj.type == 'ARMATURE':
+                meshes.update(get_bound_meshes(obj))
+
+        if not meshes:
+            self.report({'WARNING'}, "No meshes or armatures selected.")
+            return {'CANCELLED'}
+
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        for obj in meshes:
+            if obj.vertex_groups:
+                self.clean(obj)
+
+        self.report({'INFO'}, f'Vertex Groups: Total removed: ' + str(self.removed_count) + ' groups and ' + str(self.removed_weight_count) + ' zero weights')
+        return {'FINISHED'}
+
 class TarkovTools_Shared(bpy.types.Panel):
     bl_label = "Shared Tools"
     bl_idname = "EFT_SHARED"
@@ -763,8 +1596,12 @@ class TarkovTools_Shared(bpy.types.Panel):
     def draw(self, context):
         layout = self.layout
         
+        layout.prop(context.scene, "tarkov_scope")
         layout.operator(CleanLODMaterials.bl_idname, icon='MATERIAL')
         layout.operator(OBJECT_OT_CleanLODMeshes.bl_idname, icon='MESH_DATA')
+        layout.operator(OBJECT_OT_DeduplicateImages.bl_idname, icon='IMAGE_DATA')
+        layout.operator(OBJECT_OT_UseImageProxies.bl_idname, icon='IMAGE_REFERENCE')
+        layout.operator(OBJECT_OT_RestoreImageProxies.bl_idname, icon='IMAGE')
 
 class TarkovTools_Weapon(bpy.types.Panel):
     bl_label = "Weapon Tools"
@@ -779,9 +1616,13 @@ class TarkovTools_Weapon(bpy.types.Panel):
         
         layout.operator(OBJECT_OT_LoadMagazines.bl_idname, icon='OBJECT_DATA')
         layout.operator(OBJECT_OT_AssemblyWeapon.bl_idname, icon='LINKED')
+        layout.operator(OBJECT_OT_SaveWeaponPreset.bl_idname, icon='FILE_TICK')
+        layout.operator(OBJECT_OT_ApplyWeaponPreset.bl_idname, icon='PRESET')
         layout.operator(OBJECT_OT_CleanHumanBones.bl_idname, icon='BONE_DATA')
         layout.operator(OBJECT_OT_CleanEngineBones.bl_idname, icon='BONE_DATA')
         layout.operator(OBJECT_OT_CleanMuzzleFlashBones.bl_idname, icon='BONE_DATA')
+        layout.operator(OBJECT_OT_CleanVertexGroups.bl_idname, icon='GROUP_VERTEX')
+        layout.operator(OBJECT_OT_CleanActions.bl_idname, icon='ACTION')
 
 class TarkovTools_World(bpy.types.Panel):
     bl_label = "World Scene Tools"
@@ -794,26 +1635,36 @@ class TarkovTools_World(bpy.types.Panel):
     def draw(self, context):
         layout = self.layout
         
+        layout.prop(context.scene, "tarkov_scope")
         layout.operator(OBJECT_OT_CleanShadowMeshes.bl_idname, icon='LIGHT')
         layout.operator(OBJECT_OT_CleanTriggerMeshes.bl_idname, icon='XRAY')
         layout.operator(OBJECT_OT_CleanCullingMeshes.bl_idname, icon='MESH_CUBE')
         layout.operator(OBJECT_OT_CleanColliderMeshes.bl_idname, icon='MESH_ICOSPHERE')
         layout.operator(OBJECT_OT_CleanDoorHandMeshes.bl_idname, icon='HAND')
+        layout.operator(OBJECT_OT_MergeMapChunks.bl_idname, icon='MOD_BUILD')
 
 classes = [
     OBJECT_OT_LoadMagazines,
     OBJECT_OT_AssemblyWeapon,
+    OBJECT_OT_SaveWeaponPreset,
+    OBJECT_OT_ApplyWeaponPreset,
     OBJECT_OT_CleanHumanBones,
     OBJECT_OT_CleanEngineBones,
     OBJECT_OT_CleanMuzzleFlashBones,
+    OBJECT_OT_CleanVertexGroups,
+    OBJECT_OT_CleanActions,
 
     CleanLODMaterials,
+    OBJECT_OT_DeduplicateImages,
+    OBJECT_OT_UseImageProxies,
+    OBJECT_OT_RestoreImageProxies,
     OBJECT_OT_CleanLODMeshes,
     OBJECT_OT_CleanShadowMeshes,
     OBJECT_OT_CleanTriggerMeshes,
     OBJECT_OT_CleanCullingMeshes,
     OBJECT_OT_CleanColliderMeshes,
     OBJECT_OT_CleanDoorHandMeshes,
+    OBJECT_OT_MergeMapChunks,
 
     TarkovTools_Shared,
     TarkovTools_Weapon,
@@ -824,7 +1675,11 @@ def register():
     for cls in classes:
         bpy.utils.register_class(cls)
 
+    bpy.types.Scene.tarkov_scope = bpy.props.EnumProperty(name="Scope", description="Objects the cleaners work on", items=ScopeItems, default='SCENE')
+
 def unregister():
+    del bpy.types.Scene.tarkov_scope
+
     for cls in classes:
         bpy.utils.unregister_class(cls)
 
@@ -0,0 +1,542 @@
+"""Regression and performance checks for the Tarkov Toolkit operators.
+
+Run from the repository root with Blender, or with the ``bpy`` Python module:
+
+    blender -b --factory-startup --python-exit-code 1 --python tests/run_regression.py
+    python tests/run_regression.py
+
+Every case runs in its own background Blender process. The process loads one of the
+example files (or an empty scene for the generated large variants), prepares it, runs a
+single operator and compares the scene against tests/golden/<file>/<case>.json. The
+case also fails when the operator exceeds its time budget or its peak memory budget.
+Peak memory is the growth of the process' resident set while the operator runs, read
+from VmHWM after resetting it through /proc/self/clear_refs, so it is only enforced on
+Linux.
+
+Options (after ``--`` when running inside Blender):
+    --update         rewrite the golden files instead of checking them
+    --only <text>    only run cases whose "<file>/<case>" name contains the text
+"""
+import hashlib
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+
+import bpy
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+EXAMPLE_DIR = os.path.join(ROOT, "example")
+GOLDEN_DIR = os.path.join(ROOT, "tests", "golden")
+
+sys.path.insert(0, ROOT)
+import TarkovToolkit
+
+PATRON_REGEX = re.compile(r"Patron\.(\d+)$")
+PRESET_NAME = "regression"
+TOLERANCE = 0.0001
+
+MAP_NAMES = [
+    ("Rock", ""),
+    ("Rock", "_LOD0"),
+    ("Rock", "_LOD1"),
+    ("ShadowMesh", ""),
+    ("BLOCKER", ""),
+    ("Cube", ""),
+    ("culling_zone", ""),
+    ("Collider", ""),
+    ("Pull", ""),
+]
+
+
+# Scene setup
+
+def select(active, objects):
+    for obj in bpy.context.view_layer.objects:
+        obj.select_set(False)
+    for obj in objects:
+        obj.select_set(True)
+    bpy.context.view_layer.objects.active = active
+
+
+def select_armature():
+    armature = bpy.data.objects["Armature"]
+    select(armature, [armature])
+
+
+def select_patrons():
+    armature = bpy.data.objects["Armature"]
+    select(armature, [armature] + [obj for obj in bpy.context.scene.objects if PATRON_REGEX.search(obj.name)])
+
+
+def select_cartridge():
+    bpy.data.batch_remove([obj for obj in bpy.context.scene.objects if PATRON_REGEX.search(obj.name)])
+    bpy.context.view_layer.update()
+
+    armature = bpy.data.objects["Armature"]
+    cartridge = bpy.data.objects["patron_556x45nato_fulll_LOD0"]
+    select(armature, [armature, cartridge])
+
+
+def add_bones(armature, bones):
+    select(armature, [armature])
+    bpy.ops.object.mode_set(mode='EDIT')
+    for name, parent, head in bones:
+        bone = armature.data.edit_bones.new(name)
+        bone.head = head
+        bone.tail = (head[0], head[1], head[2] + 0.05)
+        if parent:
+            bone.parent = armature.data.edit_bones[parent]
+    bpy.ops.object.mode_set(mode='OBJECT')
+
+
+def build_weapon():
+    magazine = bpy.data.objects["Armature"]
+    magazine.name = "mag_stanag_armature"
+
+    weapon = bpy.data.objects.new("weapon_test", bpy.data.armatures.new("weapon_test"))
+    bpy.context.scene.collection.objects.link(weapon)
+    weapon.location = (0.5, 0.25, 0.1)
+    add_bones(weapon, [
+        ("weapon_test", None, (0.0, 0.0, 0.0)),
+        ("mod_magazine", "weapon_test", (0.0, 0.12, -0.08)),
+    ])
+    select(weapon, [weapon, magazine])
+
+
+def assemble_weapon():
+    build_weapon()
+    bpy.ops.object.assembly_weapon()
+
+    weapon = bpy.data.objects["weapon_test"]
+    select(weapon, [weapon])
+
+
+def scramble_weapon():
+    assemble_weapon()
+    bpy.ops.object.save_weapon_preset(preset_name=PRESET_NAME)
+
+    for obj in bpy.context.scene.objects:
+        if obj.parent and obj.parent.name == "weapon_test":
+            obj.parent = None
+            obj.matrix_world.identity()
+
+    weapon = bpy.data.objects["weapon_test"]
+    select(weapon, [weapon])
+
+
+def bind_mesh(mesh_obj, armature, seed):
+    rng = np.random.default_rng(seed)
+    bone_names = armature.data.bones.keys()
+    vertex_count = len(mesh_obj.data.vertices)
+
+    groups = [mesh_obj.vertex_groups.new(name=name) for name in bone_names]
+    first = rng.integers(0, len(groups), vertex_count)
+    second = rng.integers(0, len(groups), vertex_count)
+    zero = rng.integers(0, len(groups), vertex_count)
+
+    for index, group in enumerate(groups):
+        group.add(np.flatnonzero(first == index).tolist(), 0.6, 'ADD')
+        group.add(np.flatnonzero(second == index).tolist(), 0.3, 'ADD')
+        group.add(np.flatnonzero((zero == index) & (np.arange(vertex_count) % 5 == 0)).tolist(), 0.0, 'ADD')
+
+    modifier = mesh_obj.modifiers.new("Armature", 'ARMATURE')
+    modifier.object = armature
+
+
+def animate(armature, bone_names, key_count):
+    action = bpy.data.actions.new(armature.name + "_anim")
+    armature.animation_data_create().action = action
+
+    frames = np.arange(key_count, dtype=np.float32)
+    modes = ['LINEAR', 'CONSTANT', 'BEZIER']
+    for bone_index, name in enumerate(bone_names):
+        for index, mode in enumerate(modes):
+            fcurve = action.fcurves.new(f'pose.bones["{name}"].location', index=index, action_group=name)
+            fcurve.keyframe_points.add(key_count)
+            values = np.sin(frames / (8.0 + bone_index % 5) + index).astype(np.float32)
+            values[key_count // 2:] = values[key_count // 2]
+            fcurve.keyframe_points.foreach_set("co", np.column_stack([frames, values]).ravel())
+            fcurve.keyframe_points.foreach_set("interpolation", np.full(key_count, bpy.types.Keyframe.bl_rna.properties['interpolation'].enum_items[mode].value, dtype=np.int32))
+            fcurve.update()
+
+
+def rig_weapon():
+    armature = bpy.data.objects["Armature"]
+    add_bones(armature, [(f"muzzleflash_{i:03}", "weapon", (0.0, 0.5 + i * 0.01, 0.0)) for i in range(4)])
+    bind_mesh(bpy.data.objects["weapon_izhmash_6x5_LOD0"], armature, 0)
+    animate(armature, armature.data.bones.keys() + ["ghost_bone"], 100)
+    select(armature, [armature])
+
+
+def build_rig(grid_size=200, key_count=1000):
+    armature = bpy.data.objects.new("Rig", bpy.data.armatures.new("Rig"))
+    bpy.context.scene.collection.objects.link(armature)
+
+    bones = [("root", None, (0.0, 0.0, 0.0)), ("Base HumanLCollarbone", "root", (0.1, 0.0, 0.0))]
+    bones += [(f"Base HumanLFinger{i}", "Base HumanLCollarbone", (0.1, 0.0, 0.05 * i)) for i in range(10)]
+    bones += [(name, "root", (0.0, 0.01 * i, 0.0)) for i, name in enumerate(TarkovToolkit.EngineBonesNames)]
+    bones += [(f"muzzleflash_{i:03}", "root", (0.0, 0.5, 0.01 * i)) for i in range(10)]
+    bones += [(f"bone_{i:03}", "root", (0.2, 0.0, 0.01 * i)) for i in range(30)]
+    add_bones(armature, bones)
+
+    mesh = bpy.data.meshes.new("RigGrid")
+    size = grid_size
+    xs, ys = np.meshgrid(np.arange(size, dtype=np.float32), np.arange(size, dtype=np.float32))
+    coords = np.column_stack([xs.ravel() * 0.01, ys.ravel() * 0.01, np.zeros(size * size, dtype=np.float32)])
+    quads = [(y * size + x, y * size + x + 1, (y + 1) * size + x + 1, (y + 1) * size + x) for y in range(size - 1) for x in range(size - 1)]
+    mesh.from_pydata(coords.tolist(), [], quads)
+
+    mesh_obj = bpy.data.objects.new("RigGrid", mesh)
+    bpy.context.scene.collection.objects.link(mesh_obj)
+    mesh_obj.parent = armature
+
+    bind_mesh(mesh_obj, armature, 1)
+    animate(armature, armature.data.bones.keys() + [f"ghost_{i}" for i in range(10)], key_count)
+    select(armature, [armature])
+
+
+def build_map(object_count=3000):
+    mesh = bpy.data.meshes.new("MapCube")
+    mesh.from_pydata(
+        [(-1, -1, -1), (1, -1, -1), (1, 1, -1), (-1, 1, -1), (-1, -1, 1), (1, -1, 1), (1, 1, 1), (-1, 1, 1)],
+        [],
+        [(0, 3, 2, 1), (4, 5, 6, 7), (0, 1, 5, 4), (1, 2, 6, 5), (2, 3, 7, 6), (3, 0, 4, 7)],
+    )
+    mesh.uv_layers.new(name="UVMap")
+    mesh.materials.append(bpy.data.materials.new("MapMaterial"))
+
+    collection = bpy.context.scene.collection
+    block = None
+    for i in range(object_count):
+        if i % len(MAP_NAMES) == 0:
+            block = bpy.data.objects.new(f"Block_{i // len(MAP_NAMES)}", None)
+            collection.objects.link(block)
+
+        prefix, suffix = MAP_NAMES[i % len(MAP_NAMES)]
+        obj = bpy.data.objects.new(f"{prefix}_{i}{suffix}", mesh)
+        obj.location = ((i % 100) * 3.0, (i // 100) * 3.0, 0.0)
+        obj.parent = block
+        collection.objects.link(obj)
+
+    bpy.context.view_layer.update()
+
+
+def save_image(name, pixels, size, directory, file_format):
+    image = bpy.data.images.new(name, size, size, alpha=True)
+    image.pixels.foreach_set(pixels)
+    extension = {'PNG': ".png", 'TARGA': ".tga"}[file_format]
+    image.filepath_raw = os.path.join(directory, name + extension)
+    image.file_format = file_format
+    image.save()
+    return image
+
+
+def use_images(images):
+    for image in images:
+        material = bpy.data.materials.new("mat_" + image.name)
+        material.use_nodes = True
+        material.node_tree.nodes.new('ShaderNodeTexImage').image = image
+
+
+def build_images(size=256, unique_count=4):
+    directory = tempfile.mkdtemp()
+    rng = np.random.default_rng(2)
+
+    images = []
+    for i in range(unique_count):
+        pixels = np.round(rng.random(size * size * 4) * 255).astype(np.float32) / 255
+        images.append(save_image(f"tex_{i}", pixels, size, directory, 'PNG'))
+        images.append(save_image(f"tex_{i}_LOD1", pixels, size, directory, 'TARGA'))
+
+        generated = bpy.data.images.new(f"tex_{i}_generated", size, size, alpha=True)
+        generated.pixels.foreach_set(pixels)
+        images.append(generated)
+
+        non_color = bpy.data.images.load(images[-3].filepath_raw, check_existing=False)
+        non_color.name = f"tex_{i}_data"
+        non_color.colorspace_settings.name = 'Non-Color'
+        images.append(non_color)
+
+    use_images(images)
+
+
+def build_large_images(size=2048, count=4):
+    directory = tempfile.mkdtemp()
+    rng = np.random.default_rng(3)
+    use_images([save_image(f"large_{i}", rng.random(size * size * 4).astype(np.float32), size, directory, 'PNG') for i in range(count)])
+
+
+def proxy_large_images():
+    build_large_images()
+    bpy.ops.object.use_image_proxies()
+
+
+# Results
+
+def get_scene_snapshot():
+    snapshot = {}
+    for obj in bpy.context.scene.objects:
+        entry = {
+            "parent": obj.parent.name if obj.parent else None,
+            "parent_bone": obj.parent_bone if obj.parent_type == 'BONE' else None,
+            "matrix": [value for row in obj.matrix_world for value in row],
+        }
+        if obj.type == 'ARMATURE':
+            entry["bones"] = {bone.name: bone.parent.name if bone.parent else None for bone in obj.data.bones}
+        if obj.type == 'MESH':
+            entry["data"] = obj.data.name
+            entry["vertex_groups"] = obj.vertex_groups.keys()
+        snapshot[obj.name] = entry
+    return snapshot
+
+
+def get_weight_summary():
+    groups = 0
+    weights = 0.0
+    for obj in bpy.context.scene.objects:
+        if obj.type == 'MESH':
+            groups += len(obj.vertex_groups)
+            weights += sum(element.weight for vertex in obj.data.vertices for element in vertex.groups)
+    return [groups, round(weights, 2)]
+
+
+def get_result(summary):
+    result = {
+        "actions": {action.name: [len(action.fcurves), sum(len(fcurve.keyframe_points) for fcurve in action.fcurves)] for action in bpy.data.actions},
+        "images": {image.name: [image.size[0], image.size[1], image.colorspace_settings.name, image.users, "tarkov_full_path" in image] for image in bpy.data.images if image.type != 'RENDER_RESULT'},
+        "materials": sorted(bpy.data.materials.keys()),
+        "weights": get_weight_summary(),
+    }
+
+    snapshot = get_scene_snapshot()
+    if summary:
+        result["objects"] = {
+            "count": len(snapshot),
+            "names": hashlib.sha1("\n".join(sorted(snapshot)).encode()).hexdigest(),
+            "parents": hashlib.sha1("\n".join(f"{name}:{entry['parent']}:{entry['parent_bone']}" for name, entry in sorted(snapshot.items())).encode()).hexdigest(),
+            "vertices": sum(len(mesh.vertices) for mesh in bpy.data.meshes),
+            "meshes": len(bpy.data.meshes),
+        }
+    else:
+        result["objects"] = snapshot
+
+    preset_path = TarkovToolkit.get_weapon_preset_path(PRESET_NAME)
+    if os.path.isfile(preset_path):
+        with open(preset_path) as file:
+            result["preset"] = json.load(file)
+    return result
+
+
+def compare_scene_snapshot(expected, current, path="", tolerance=TOLERANCE):
+    if isinstance(expected, dict) and isinstance(current, dict):
+        mismatches = [f"{path}/{key} missing" for key in sorted(expected.keys() - current.keys())]
+        mismatches += [f"{path}/{key} unexpected" for key in sorted(current.keys() - expected.keys())]
+        for key in sorted(expected.keys() & current.keys()):
+            mismatches += compare_scene_snapshot(expected[key], current[key], f"{path}/{key}", tolerance)
+        return mismatches
+
+    if isinstance(expected, list) and isinstance(current, list) and len(expected) == len(current):
+        mismatches = []
+        for index, (old, new) in enumerate(zip(expected, current)):
+            mismatches += compare_scene_snapshot(old, new, f"{path}[{index}]", tolerance)
+        return mismatches
+
+    if isinstance(expected, float) and isinstance(current, (int, float)) and not isinstance(current, bool):
+        return [] if abs(expected - current) <= tolerance else [f"{path} is {current} instead of {expected}"]
+
+    return [] if expected == current else [f"{path} is {current} instead of {expected}"]
+
+
+# Cases: name -> (setup, operator, operator arguments, time budget in seconds, peak memory budget in MB, summary only)
+# Budgets are three times the measured time (at least 50ms of headroom) and 1.5 times the measured peak plus 16MB,
+# measured with Blender 4.2 on Linux. Re-measure them when an operator gets intentionally slower or faster.
+
+SHARED_CASES = {
+    "remove_lod_materials": (select_armature, "remove_lod_materials", {}, 0.05, 16, False),
+    "remove_lod_meshes": (select_armature, "remove_lod_meshes", {}, 0.05, 16, False),
+    "remove_shadow_meshes": (select_armature, "remove_shadow_meshes", {}, 0.05, 16, False),
+    "remove_trigger_meshes": (select_armature, "remove_trigger_meshes", {}, 0.05, 16, False),
+    "remove_culling_meshes": (select_armature, "remove_culling_meshes", {}, 0.05, 16, False),
+    "remove_collider_meshes": (select_armature, "remove_collider_meshes", {}, 0.05, 16, False),
+    "remove_door_hand_meshes": (select_armature, "remove_door_hand_meshes", {}, 0.05, 16, False),
+    "merge_map_chunks": (select_armature, "merge_map_chunks", {}, 0.06, 19, False),
+    "deduplicate_images": (select_armature, "deduplicate_images", {}, 0.05, 16, False),
+    "use_image_proxies": (select_armature, "use_image_proxies", {}, 0.05, 16, False),
+    "restore_image_proxies": (select_armature, "restore_image_proxies", {}, 0.05, 16, False),
+    "clean_human_bones": (select_armature, "clean_human_bones", {"remove_vertex_groups": True}, 0.05, 17, False),
+    "clean_engine_bones": (select_armature, "clean_engine_bones", {"remove_vertex_groups": True}, 0.05, 17, False),
+    "clean_muzzleflash_bones": (select_armature, "clean_muzzleflash_bones", {"remove_vertex_groups": True}, 0.05, 17, False),
+    "clean_vertex_groups": (select_armature, "clean_vertex_groups", {}, 0.05, 16, False),
+    "clean_actions": (select_armature, "clean_actions", {"all_actions": True, "tolerance": 0.001}, 0.05, 17, False),
+}
+
+CASES = {
+    "MagazineLoading": dict(SHARED_CASES, **{
+        "load_magazine": (select_patrons, "load_tarkov_magazines", {}, 0.05, 17, False),
+        "load_magazine_instanced": (select_cartridge, "load_tarkov_magazines", {"use_instances": True}, 0.05, 17, False),
+        "load_magazine_instanced_2": (select_cartridge, "load_tarkov_magazines", {"use_instances": True, "round_count": 2}, 0.05, 17, False),
+        "assembly_weapon": (build_weapon, "assembly_weapon", {}, 0.05, 16, False),
+        "save_weapon_preset": (assemble_weapon, "save_weapon_preset", {"preset_name": PRESET_NAME}, 0.05, 17, False),
+        "apply_weapon_preset": (scramble_weapon, "apply_weapon_preset", {"preset_name": PRESET_NAME}, 0.05, 16, False),
+    }),
+    "ViewmodelCleaning": dict(SHARED_CASES, **{
+        "rigged_clean_human_bones": (rig_weapon, "clean_human_bones", {"remove_vertex_groups": True}, 0.06, 19, False),
+        "rigged_clean_engine_bones": (rig_weapon, "clean_engine_bones", {"remove_vertex_groups": True}, 0.06, 19, False),
+        "rigged_clean_muzzleflash_bones": (rig_weapon, "clean_muzzleflash_bones", {"remove_vertex_groups": True}, 0.06, 19, False),
+        "rigged_clean_vertex_groups": (rig_weapon, "clean_vertex_groups", {}, 0.23, 22, False),
+        "rigged_clean_actions": (rig_weapon, "clean_actions", {"tolerance": 0.001}, 0.93, 19, False),
+    }),
+    "generated": {
+        "map_remove_lod_meshes": (build_map, "remove_lod_meshes", {}, 7.6, 20, True),
+        "map_remove_shadow_meshes": (build_map, "remove_shadow_meshes", {}, 5.5, 19, True),
+        "map_remove_trigger_meshes": (build_map, "remove_trigger_meshes", {}, 9.7, 20, True),
+        "map_remove_culling_meshes": (build_map, "remove_culling_meshes", {}, 5.7, 19, True),
+        "map_remove_collider_meshes": (build_map, "remove_collider_meshes", {}, 7.2, 19, True),
+        "map_remove_door_hand_meshes": (build_map, "remove_door_hand_meshes", {}, 5.9, 19, True),
+        "map_merge_map_chunks": (build_map, "merge_map_chunks", {"cell_size": 50.0}, 9.6, 44, True),
+        "rig_clean_human_bones": (build_rig, "clean_human_bones", {"remove_vertex_groups": True}, 0.15, 45, True),
+        "rig_clean_engine_bones": (build_rig, "clean_engine_bones", {"remove_vertex_groups": True}, 0.21, 45, True),
+        "rig_clean_muzzleflash_bones": (build_rig, "clean_muzzleflash_bones", {"remove_vertex_groups": True}, 0.17, 45, True),
+        "rig_clean_vertex_groups": (build_rig, "clean_vertex_groups", {}, 1.0, 68, True),
+        "rig_clean_actions": (build_rig, "clean_actions", {"tolerance": 0.001}, 9.9, 42, True),
+        "images_deduplicate_images": (build_images, "deduplicate_images", {}, 0.12, 22, False),
+        "images_use_image_proxies": (build_large_images, "use_image_proxies", {}, 2.7, 89, False),
+        "images_restore_image_proxies": (proxy_large_images, "restore_image_proxies", {}, 0.05, 16, False),
+    },
+}
+
+
+# Child process: runs a single case
+
+def reset(file_key):
+    if file_key == "generated":
+        bpy.ops.wm.read_homefile(use_empty=True)
+    else:
+        bpy.ops.wm.open_mainfile(filepath=os.path.join(EXAMPLE_DIR, file_key + ".blend"), load_ui=False)
+    bpy.context.scene.tarkov_scope = 'SCENE'
+
+
+def read_memory(field):
+    with open("/proc/self/status") as file:
+        for line in file:
+            if line.startswith(field + ":"):
+                return int(line.split()[1]) * 1024
+    return None
+
+
+def reset_peak_memory():
+    try:
+        with open("/proc/self/clear_refs", 'w') as file:
+            file.write("5")
+        return read_memory("VmRSS")
+    except OSError:
+        return None
+
+
+def run_case(case_name, update):
+    file_key, name = case_name.split("/")
+    setup, operator, arguments, time_budget, memory_budget, summary = CASES[file_key][name]
+
+    try:
+        TarkovToolkit.register()
+    except ValueError:
+        pass
+
+    reset(file_key)
+    setup()
+
+    baseline = reset_peak_memory()
+    time_s = time.perf_counter()
+    result = getattr(bpy.ops.object, operator)(**arguments)
+    elapsed = time.perf_counter() - time_s
+    peak = (read_memory("VmHWM") - baseline) / (1024 * 1024) if baseline is not None else None
+
+    failures = []
+    if result != {'FINISHED'}:
+        failures.append(f"returned {result}")
+
+    current = get_result(summary)
+    golden_path = os.path.join(GOLDEN_DIR, file_key, name + ".json")
+    if update:
+        os.makedirs(os.path.dirname(golden_path), exist_ok=True)
+        with open(golden_path, 'w') as file:
+            json.dump(current, file, indent=1, sort_keys=True)
+            file.write("\n")
+    elif not os.path.isfile(golden_path):
+        failures.append(f"missing golden file {os.path.relpath(golden_path, ROOT)}, run with --update")
+    else:
+        with open(golden_path) as file:
+            failures += compare_scene_snapshot(json.load(file), json.loads(json.dumps(current)))
+
+    if elapsed > time_budget:
+        failures.append(f"took {elapsed:.3f}s, budget {time_budget}s")
+    if peak is not None and peak > memory_budget:
+        failures.append(f"peaked at {peak:.1f}MB, budget {memory_budget}MB")
+
+    print("RESULT " + json.dumps({"time": elapsed, "memory": peak, "failures": failures}))
+
+
+# Parent process: spawns one child per case
+
+def get_command():
+    script = os.path.abspath(__file__)
+    if bpy.app.binary_path:
+        return [bpy.app.binary_path, "-b", "--factory-startup", "--python-exit-code", "1", "--python", script, "--"]
+    return [sys.executable, script]
+
+
+def run_all(only, update):
+    command = get_command()
+    failed = 0
+    total = 0
+
+    for file_key, cases in CASES.items():
+        for name, case in cases.items():
+            case_name = f"{file_key}/{name}"
+            if only and only not in case_name:
+                continue
+            total += 1
+
+            # Presets and image proxies are written to the user data directory, keep each case's files separate
+            with tempfile.TemporaryDirectory() as user_dir:
+                env = dict(os.environ, BLENDER_USER_DATAFILES=user_dir)
+                arguments = ["--case", case_name] + (["--update"] if update else [])
+                process = subprocess.run(command + arguments, env=env, capture_output=True, text=True)
+
+            lines = [line for line in process.stdout.splitlines() if line.startswith("RESULT ")]
+            if lines:
+                report = json.loads(lines[-1][len("RESULT "):])
+            else:
+                report = {"time": 0.0, "memory": None, "failures": ["crashed:"] + process.stderr.splitlines()[-20:]}
+
+            _, _, _, time_budget, memory_budget, _ = case
+            memory = "n/a" if report["memory"] is None else f"{report['memory']:.1f}MB"
+            status = "FAIL" if report["failures"] else "ok"
+            print(f"[{status}] {case_name}: {report['time']:.3f}s / {time_budget}s, {memory} / {memory_budget}MB")
+            for failure in report["failures"][:20]:
+                print(f"    {failure}")
+            failed += bool(report["failures"])
+
+    print(f"{total - failed}/{total} cases passed")
+    return failed == 0
+
+
+def main():
+    arguments = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:]
+    update = "--update" in arguments
+
+    if "--case" in arguments:
+        run_case(arguments[arguments.index("--case") + 1], update)
+        return
+
+    only = arguments[arguments.index("--only") + 1] if "--only" in arguments else None
+    if not run_all(only, update):
+        sys.exit(1)
+
+
+main()